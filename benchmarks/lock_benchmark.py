@@ -2,7 +2,7 @@
 
 Covers an acquire + release cycle against the in-memory sync
 backend, which is the fast path used in tests and single-process
-deployments.
+deployments, both through `Lock` and on the adapter alone.
 
 Run with: python benchmarks/lock_benchmark.py
 """
@@ -12,6 +12,7 @@ from __future__ import annotations
 import asyncio
 import time
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
 from grelmicro.coordination.lock import Lock
 from grelmicro.coordination.memory import MemoryLockAdapter
@@ -36,7 +37,7 @@ async def _measure_async(
 
 
 async def _bench_lock(iterations: int) -> None:
-    """Measure an acquire + release cycle on the in-memory lock."""
+    """Measure an acquire + release cycle on the in-memory lock and adapter."""
     async with MemoryLockAdapter() as backend:
         lock = Lock("bench", backend=backend)
 
@@ -50,6 +51,18 @@ async def _bench_lock(iterations: int) -> None:
             iterations,
         )
 
+        holder = uuid4().hex
+
+        async def adapter_acquire_release() -> None:
+            await backend.acquire(name="bench", token=holder, duration=60)
+            await backend.release(name="bench", token=holder)
+
+        await _measure_async(
+            "adapter acquire + release",
+            adapter_acquire_release,
+            iterations,
+        )
+
 
 def main() -> None:
     """Run all benchmarks."""
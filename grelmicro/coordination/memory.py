@@ -51,8 +51,9 @@ class MemoryLockAdapter(LockBackend):
         self, *, name: str, token: str, duration: float
     ) -> int | None:
         """Acquire the lock, returning the fencing token or `None`."""
+        now = monotonic()
         current_token, expire_at = self._locks.get(name, (None, 0))
-        free = current_token is None or expire_at < monotonic()
+        free = current_token is None or expire_at < now
         if free or current_token == token:
             if free:
                 # Free-to-held transition: a new holder or a takeover of an
@@ -60,17 +61,18 @@ class MemoryLockAdapter(LockBackend):
                 # counter persists for the adapter lifetime, even across
                 # release, so re-acquire keeps climbing.
                 self._fences[name] = self._fences.get(name, 0) + 1
-            self._locks[name] = (token, monotonic() + duration)
+            self._locks[name] = (token, now + duration)
             return self._fences[name]
         return None
 
     async def release(self, *, name: str, token: str) -> bool:
         """Release the lock."""
+        now = monotonic()
         current_token, expire_at = self._locks.get(name, (None, 0))
-        if current_token == token and expire_at >= monotonic():
+        if current_token == token and expire_at >= now:
             del self._locks[name]
             return True
-        if current_token and expire_at < monotonic():
+        if current_token and expire_at < now:
             del self._locks[name]
         return False
 
@@ -8,7 +8,6 @@ from uuid import uuid4
 
 import pytest
 from anyio import sleep
-from testcontainers.redis import RedisContainer
 
 from grelmicro.coordination.redis import RedisLeaderElectionAdapter, _as_str
 from grelmicro.providers.redis import RedisProvider
@@ -144,25 +143,18 @@ def monkeypatch() -> Generator[pytest.MonkeyPatch, None, None]:
     monkeypatch.undo()
 
 
-@pytest.fixture(scope="module")
-def container() -> Generator[RedisContainer, None, None]:
-    """Redis Test Container."""
-    with RedisContainer() as container:
-        yield container
-
-
 @pytest.fixture
 async def backend(
-    container: RedisContainer,
+    redis_url: str,
 ) -> AsyncGenerator[RedisLeaderElectionAdapter]:
-    """Redis Leader Election Backend bound to the container."""
-    port = container.get_exposed_port(6379)
-    provider = RedisProvider(f"redis://localhost:{port}/0")
+    """Redis Leader Election Backend bound to the shared server."""
+    provider = RedisProvider(redis_url)
     async with RedisLeaderElectionAdapter(provider=provider) as backend:
         yield backend
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_acquire_fresh(backend: RedisLeaderElectionAdapter) -> None:
     """A fresh election is acquired with zero transitions."""
     name = "acquire_fresh" + uuid4().hex
@@ -179,6 +171,7 @@ async def test_acquire_fresh(backend: RedisLeaderElectionAdapter) -> None:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_renew_same_holder_keeps_transitions(
     backend: RedisLeaderElectionAdapter,
 ) -> None:
@@ -200,6 +193,7 @@ async def test_renew_same_holder_keeps_transitions(
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_live_lease_blocks_other_holder(
     backend: RedisLeaderElectionAdapter,
 ) -> None:
@@ -218,6 +212,7 @@ async def test_live_lease_blocks_other_holder(
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_takeover_after_expiry_increments_transitions(
     backend: RedisLeaderElectionAdapter,
 ) -> None:
@@ -238,6 +233,7 @@ async def test_takeover_after_expiry_increments_transitions(
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_reacquire_after_expiry_keeps_transitions(
     backend: RedisLeaderElectionAdapter,
 ) -> None:
@@ -256,6 +252,7 @@ async def test_reacquire_after_expiry_keeps_transitions(
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_release_held_lease(
     backend: RedisLeaderElectionAdapter,
 ) -> None:
@@ -273,6 +270,7 @@ async def test_release_held_lease(
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_release_other_holder_denied(
     backend: RedisLeaderElectionAdapter,
 ) -> None:
@@ -288,6 +286,7 @@ async def test_release_other_holder_denied(
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_get_returns_none_after_expiry(
     backend: RedisLeaderElectionAdapter,
 ) -> None:
@@ -306,6 +305,7 @@ async def test_get_returns_none_after_expiry(
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_metadata_round_trips(
     backend: RedisLeaderElectionAdapter,
 ) -> None:
@@ -1,13 +1,12 @@
 """Tests for the Redis Schedule Adapter."""
 
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator
 from types import TracebackType
 from typing import Self
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
-from testcontainers.redis import RedisContainer
 
 from grelmicro.coordination.redis import RedisScheduleAdapter
 from grelmicro.providers.redis import RedisProvider
@@ -119,20 +118,12 @@ async def test_aenter_aexit_borrowed_provider_left_alone() -> None:
     assert stub.exit_count == 0
 
 
-@pytest.fixture(scope="module")
-def container() -> Generator[RedisContainer, None, None]:
-    """Redis Test Container."""
-    with RedisContainer() as container:
-        yield container
-
-
 @pytest.fixture
 async def backend(
-    container: RedisContainer,
+    redis_url: str,
 ) -> AsyncGenerator[RedisScheduleAdapter]:
-    """Redis Schedule Adapter bound to the container."""
-    port = container.get_exposed_port(6379)
-    provider = RedisProvider(f"redis://localhost:{port}/0")
+    """Redis Schedule Adapter bound to the shared server."""
+    provider = RedisProvider(redis_url)
     async with RedisScheduleAdapter(provider=provider) as backend:
         yield backend
 
@@ -142,6 +133,7 @@ NEW = 160.0
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_last_fired_is_none_before_any_claim(
     backend: RedisScheduleAdapter,
 ) -> None:
@@ -150,6 +142,7 @@ async def test_last_fired_is_none_before_any_claim(
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_claim_sets_last_fired(backend: RedisScheduleAdapter) -> None:
     """A first claim stores the due epoch and returns `True`."""
     name = "claim" + uuid4().hex
@@ -161,6 +154,7 @@ async def test_claim_sets_last_fired(backend: RedisScheduleAdapter) -> None:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_claim_advances_to_a_newer_due(
     backend: RedisScheduleAdapter,
 ) -> None:
@@ -175,6 +169,7 @@ async def test_claim_advances_to_a_newer_due(
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("redis")
 async def test_claim_rejects_an_equal_or_older_due(
     backend: RedisScheduleAdapter,
 ) -> None:
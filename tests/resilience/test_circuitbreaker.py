@@ -4,17 +4,18 @@ import asyncio
 import logging
 import sys
 import threading
-from collections.abc import AsyncGenerator
-from contextlib import AsyncExitStack, suppress
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import suppress
+from dataclasses import replace
 from datetime import UTC, datetime
 from types import TracebackType
 from typing import Any, ClassVar, Literal, Self
 
 import pydantic
 import pytest
-from freezegun import freeze_time
 
 from grelmicro import Grelmicro
+from grelmicro.clock import VirtualClock
 from grelmicro.resilience import CircuitBreakerRegistry
 from grelmicro.resilience._protocol import (
     CircuitBreakerSnapshot,
@@ -29,7 +30,6 @@ from grelmicro.resilience.circuitbreaker import (
     ErrorDetails,
     _TransitionCause,
 )
-from grelmicro.resilience.circuitbreaker import memory as cb_memory_module
 from grelmicro.resilience.circuitbreaker.memory import (
     MemoryCircuitBreakerAdapter,
 )
@@ -49,22 +49,97 @@ ALL_STATES = [
     CircuitBreakerState.FORCED_OPEN,
 ]
 
+PERMITTED_STATES = [
+    CircuitBreakerState.CLOSED,
+    CircuitBreakerState.HALF_OPEN,
+    CircuitBreakerState.FORCED_CLOSED,
+]
+"""States that let a call through when the breaker has spare capacity."""
+
+IGNORE_EXCEPTIONS_CASES = {
+    "single": (SentinelError, SentinelError),
+    "tuple": ((SentinelError, RuntimeError), SentinelError),
+    "unlisted": ((ValueError, RuntimeError), RuntimeError),
+}
+"""`(ignore_exceptions, error)` pairs keyed by test id."""
+
+IGNORE_EXCEPTIONS_MATRIX = [
+    pytest.param(state, ignore_exceptions, error, id=f"{state}-{case}")
+    for state in PERMITTED_STATES
+    for case, (ignore_exceptions, error) in IGNORE_EXCEPTIONS_CASES.items()
+]
+"""`(state, ignore_exceptions, error)` cases for the ignore-exceptions tests."""
 
-@pytest.fixture(autouse=True)
+COUNT_MATRIX = [
+    (state, count) for state in PERMITTED_STATES for count in (0, 1, 3, 5)
+]
+"""`(state, count)` cases for the per-state counter tests."""
+
+COUNT_IDS = [f"{state}-{count}" for state, count in COUNT_MATRIX]
+
+SUCCESS_COUNT_MATRIX = [
+    (state, error, count)
+    for state, count in COUNT_MATRIX
+    for error in (None, sentinel_error)
+]
+"""`(state, error, count)` cases where every call counts as a success.
+
+A `sentinel_error` call is a success because the breaker ignores
+`SentinelError`.
+"""
+
+SUCCESS_COUNT_IDS = [
+    f"{state}-{'ignored' if error else 'ok'}-{count}"
+    for state, error, count in SUCCESS_COUNT_MATRIX
+]
+
+TRANSITION_MATRIX = [
+    (from_state, to_state)
+    for from_state in ALL_STATES
+    for to_state in ALL_STATES
+]
+"""Every `(from_state, to_state)` pair."""
+
+TRANSITION_IDS = [f"{a}-to-{b}" for a, b in TRANSITION_MATRIX]
+
+EMPTY_METRICS = CircuitBreakerMetrics(
+    name="test",
+    state=CircuitBreakerState.CLOSED,
+    active_calls=0,
+    total_error_count=0,
+    total_success_count=0,
+    consecutive_error_count=0,
+    consecutive_success_count=0,
+    last_error=None,
+)
+"""Metrics of a `"test"` breaker that has recorded no call.
+
+Tests expecting other values derive them with `dataclasses.replace`.
+"""
+
+
+@pytest.fixture(scope="module", autouse=True)
 async def _cb_app(
     _cb_backend: MemoryCircuitBreakerAdapter,
 ) -> AsyncGenerator[Grelmicro]:
-    """Open a `Grelmicro` app holding the in-memory CB backend for every test."""
+    """Open a `Grelmicro` app holding the in-memory CB backend for the module."""
     async with Grelmicro(uses=[CircuitBreakerRegistry(_cb_backend)]) as micro:
         yield micro
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def _cb_backend() -> MemoryCircuitBreakerAdapter:
-    """Construct the in-memory CB backend fixture (one per test)."""
+    """Construct the in-memory CB backend fixture (one per module)."""
     return MemoryCircuitBreakerAdapter()
 
 
+@pytest.fixture(autouse=True)
+def _cb_reset(_cb_backend: MemoryCircuitBreakerAdapter) -> Generator[None]:
+    """Drop every breaker's state after each test, as closing the app would."""
+    yield
+    _cb_backend._states.clear()
+
+
 async def transition(cb: CircuitBreaker, state: CircuitBreakerState) -> None:
     """Drive the circuit breaker into the specified state for white-box tests."""
     await cb._transition(state, _TransitionCause.MANUAL)
@@ -92,7 +167,9 @@ async def create_circuit(
         if v is not None and v != ()
     }
     cb = CircuitBreaker.consecutive_count("test", **kwargs)
-    await transition(cb, state)
+    if state is not CircuitBreakerState.CLOSED:
+        # A new breaker starts closed, so only other states need a transition.
+        await transition(cb, state)
     return cb
 
 
@@ -109,6 +186,34 @@ async def generate_error(cb: CircuitBreaker) -> None:
             raise sentinel_error
 
 
+async def record_calls(
+    cb: CircuitBreaker, count: int, error: Exception | None = None
+) -> None:
+    """Record `count` calls in the circuit breaker, failing with `error` if set.
+
+    Drives the breaker's context protocol directly so a batch of calls
+    needs no `async with` block or raised exception per iteration.
+    """
+    exc_type = type(error) if error is not None else None
+    for _ in range(count):
+        await cb.__aenter__()
+        await cb.__aexit__(exc_type, error, None)
+
+
+def raised_type(func: Callable[[], object]) -> type[Exception] | None:
+    """Call `func` and return the type of the exception it raised, if any.
+
+    Lets a test run several sync calls in one worker-thread hop and
+    assert on every outcome afterwards. A `pytest.fail` inside `func`
+    is not an `Exception`, so it still propagates.
+    """
+    try:
+        func()
+    except Exception as exc:  # noqa: BLE001
+        return type(exc)
+    return None
+
+
 @pytest.fixture(
     params=[
         CircuitBreakerState.OPEN,
@@ -134,13 +239,7 @@ async def circuit_call_not_permitted(
         yield cb
 
 
-@pytest.fixture(
-    params=[
-        CircuitBreakerState.CLOSED,
-        CircuitBreakerState.HALF_OPEN,
-        CircuitBreakerState.FORCED_CLOSED,
-    ]
-)
+@pytest.fixture(params=PERMITTED_STATES)
 async def circuit_call_permitted(
     request: pytest.FixtureRequest,
 ) -> CircuitBreaker:
@@ -304,9 +403,13 @@ async def test_circuit_from_thread_decorator_with_call_permitted(
     def another_protected_function(pos: str) -> bool:
         return bool(pos == "positional")
 
-    # Act & Assert
-    await asyncio.to_thread(protected_function)
-    await asyncio.to_thread(another_protected_function, "positional")
+    # Act
+    results = await asyncio.to_thread(
+        lambda: (protected_function(), another_protected_function("positional"))
+    )
+
+    # Assert
+    assert results == (None, True)
 
 
 async def test_circuit_error_raises(
@@ -368,11 +471,16 @@ async def test_circuit_from_thread_decorator_error_raises(
     def another_protected_function() -> None:
         raise sentinel_error
 
-    # Act & Assert
-    with pytest.raises(SentinelError):
-        await asyncio.to_thread(protected_function)
-    with pytest.raises(SentinelError):
-        await asyncio.to_thread(another_protected_function)
+    # Act
+    raised = await asyncio.to_thread(
+        lambda: (
+            raised_type(protected_function),
+            raised_type(another_protected_function),
+        )
+    )
+
+    # Assert
+    assert raised == (SentinelError, SentinelError)
 
 
 async def test_circuit_with_call_not_permitted(
@@ -435,11 +543,16 @@ async def test_circuit_from_thread_decorator_with_call_not_permitted(
     def another_protected_function() -> None:
         pytest.fail("Expected not reached")
 
-    # Act & Assert
-    with pytest.raises(CircuitBreakerError):
-        await asyncio.to_thread(protected_function)
-    with pytest.raises(CircuitBreakerError):
-        await asyncio.to_thread(another_protected_function)
+    # Act
+    raised = await asyncio.to_thread(
+        lambda: (
+            raised_type(protected_function),
+            raised_type(another_protected_function),
+        )
+    )
+
+    # Assert
+    assert raised == (CircuitBreakerError, CircuitBreakerError)
 
 
 @pytest.mark.parametrize("error_count", [1, 3, 5])
@@ -457,17 +570,16 @@ async def test_circuit_transition_to_open(error_count: int) -> None:
 
 
 async def test_circuit_transition_to_half_open_after_timeout(
-    monkeypatch: pytest.MonkeyPatch,
+    clock: VirtualClock,
 ) -> None:
     """Test circuit breaker transitions to half-open after reset timeout."""
     # Arrange
     cb = await create_circuit(
         CircuitBreakerState.OPEN, success_threshold=2
     )  # Ensure it doesn't close immediately
-    # Push monotonic past the cool_down, but well inside the stored-state
+    # Advance past the cool_down, but well inside the stored-state
     # lifetime: a jump longer than that forgets the circuit by design.
-    resume = cb_memory_module.monotonic() + 60
-    monkeypatch.setattr(cb_memory_module, "monotonic", lambda: resume)
+    await clock.advance(60)
 
     # Act
     await generate_success(cb)
@@ -532,20 +644,8 @@ async def test_circuit_transition_from_half_open_to_open(
 
 
 @pytest.mark.parametrize(
-    "state",
-    [
-        CircuitBreakerState.CLOSED,
-        CircuitBreakerState.HALF_OPEN,
-        CircuitBreakerState.FORCED_CLOSED,
-    ],
-)
-@pytest.mark.parametrize(
-    ("ignore_exceptions", "error"),
-    [
-        (SentinelError, SentinelError),
-        ((SentinelError, RuntimeError), SentinelError),
-        ((ValueError, RuntimeError), RuntimeError),
-    ],
+    ("state", "ignore_exceptions", "error"),
+    IGNORE_EXCEPTIONS_MATRIX,
 )
 async def test_circuit_with_ignore_exceptions(
     ignore_exceptions: type[Exception] | tuple[type[Exception], ...],
@@ -567,20 +667,8 @@ async def test_circuit_with_ignore_exceptions(
 
 
 @pytest.mark.parametrize(
-    "state",
-    [
-        CircuitBreakerState.CLOSED,
-        CircuitBreakerState.HALF_OPEN,
-        CircuitBreakerState.FORCED_CLOSED,
-    ],
-)
-@pytest.mark.parametrize(
-    ("ignore_exceptions", "error"),
-    [
-        (SentinelError, SentinelError),
-        ((SentinelError, RuntimeError), SentinelError),
-        ((ValueError, RuntimeError), RuntimeError),
-    ],
+    ("state", "ignore_exceptions", "error"),
+    IGNORE_EXCEPTIONS_MATRIX,
 )
 async def test_circuit_from_thread_with_ignore_exceptions(
     ignore_exceptions: type[Exception] | tuple[type[Exception], ...],
@@ -604,11 +692,11 @@ async def test_circuit_from_thread_with_ignore_exceptions(
         await asyncio.to_thread(sync)
 
 
-@freeze_time()
 async def test_circuit_breaker_last_error() -> None:
     """Test error info is properly recorded."""
     # Arrange
     cb = CircuitBreaker("test")
+    before = datetime.now(UTC)
 
     # Act
     with suppress(SentinelError):
@@ -617,7 +705,8 @@ async def test_circuit_breaker_last_error() -> None:
 
     # Assert
     assert cb.last_error == sentinel_error
-    assert cb.last_error_time == datetime.now(UTC)
+    assert cb.last_error_time is not None
+    assert before <= cb.last_error_time <= datetime.now(UTC)
 
 
 async def test_circuit_metrics_initial() -> None:
@@ -629,66 +718,26 @@ async def test_circuit_metrics_initial() -> None:
     stats = cb.metrics()
 
     # Assert
-    assert stats == CircuitBreakerMetrics(
-        name="test",
-        state=CircuitBreakerState.CLOSED,
-        active_calls=0,
-        total_error_count=0,
-        total_success_count=0,
-        consecutive_error_count=0,
-        consecutive_success_count=0,
-        last_error=None,
-    )
-
-
-@pytest.mark.parametrize("success_count", [0, 1, 3, 5])
-async def test_circuit_metrics_counters_with_successes(
-    circuit_call_permitted: CircuitBreaker, success_count: int
-) -> None:
-    """Test metrics in half-open state."""
-    # Arrange
-    for _ in range(success_count):
-        async with circuit_call_permitted:
-            pass
-
-    # Act
-    stats = circuit_call_permitted.metrics()
-
-    # Assert
-    # Forced states pause strategy-side counters (matches Redis and
-    # resilience4j). Per-replica totals still tick.
-    expected_consecutive = (
-        0
-        if circuit_call_permitted.state == CircuitBreakerState.FORCED_CLOSED
-        else success_count
-    )
-    assert stats == CircuitBreakerMetrics(
-        name=circuit_call_permitted.name,
-        state=circuit_call_permitted.state,
-        active_calls=0,
-        total_error_count=0,
-        total_success_count=success_count,
-        consecutive_error_count=0,
-        consecutive_success_count=expected_consecutive,
-        last_error=None,
-    )
+    assert stats == EMPTY_METRICS
 
 
 @pytest.mark.parametrize("error_count", [1, 3, 5])
-@freeze_time()
 async def test_circuit_metrics_with_errors(
     circuit_call_permitted: CircuitBreaker,
     error_count: int,
 ) -> None:
     """Test metrics with errors in various states."""
     # Arrange
-    for _ in range(error_count):
-        await generate_error(circuit_call_permitted)
+    before = datetime.now(UTC)
+    await record_calls(circuit_call_permitted, error_count, sentinel_error)
 
     # Act
     stats = circuit_call_permitted.metrics()
 
     # Assert
+    error_time = circuit_call_permitted.last_error_time
+    assert error_time is not None
+    assert before <= error_time <= datetime.now(UTC)
     # Forced states pause strategy-side counters (matches Redis and
     # resilience4j). Per-replica totals still tick.
     expected_consecutive_errors = (
@@ -696,79 +745,57 @@ async def test_circuit_metrics_with_errors(
         if circuit_call_permitted.state == CircuitBreakerState.FORCED_CLOSED
         else error_count
     )
-    assert stats == CircuitBreakerMetrics(
-        name=circuit_call_permitted.name,
+    assert stats == replace(
+        EMPTY_METRICS,
         state=circuit_call_permitted.state,
-        active_calls=0,
         total_error_count=error_count,
-        total_success_count=0,
         consecutive_error_count=expected_consecutive_errors,
-        consecutive_success_count=0,
         last_error=ErrorDetails(
             type=SentinelError.__name__,
             msg=str(sentinel_error),
-            time=datetime.now(UTC),
+            time=error_time,
         ),
     )
 
 
 @pytest.mark.parametrize(
-    "state",
-    [
-        CircuitBreakerState.CLOSED,
-        CircuitBreakerState.HALF_OPEN,
-        CircuitBreakerState.FORCED_CLOSED,
-    ],
+    ("state", "error", "success_count"),
+    SUCCESS_COUNT_MATRIX,
+    ids=SUCCESS_COUNT_IDS,
 )
-@pytest.mark.parametrize("success_count", [0, 1, 3, 5])
-async def test_circuit_metrics_counters_with_ignore_exceptions(
-    state: CircuitBreakerState, success_count: int
+async def test_circuit_metrics_counters_with_successes(
+    state: CircuitBreakerState,
+    error: Exception | None,
+    success_count: int,
 ) -> None:
-    """Test metrics when errors are ignored."""
+    """Test success metrics for plain successes and ignored errors."""
     # Arrange
     cb = await create_circuit(
         state,
         ignore_exceptions=SentinelError,
-        success_threshold=success_count + 1,
-    )  # success_threshold=count+1 avoids immediate closure
-    for _ in range(success_count):
-        with suppress(SentinelError):
-            async with cb:
-                raise sentinel_error
+        error_threshold=sys.maxsize,
+        success_threshold=sys.maxsize,
+    )
+    await record_calls(cb, success_count, error)
 
     # Act
     stats = cb.metrics()
 
     # Assert
-    # Forced states pause strategy-side counters; CLOSED and HALF_OPEN
-    # accumulate consecutive successes.
+    # Forced states pause strategy-side counters (matches Redis and
+    # resilience4j). Per-replica totals still tick.
     expected_consecutive = (
         0 if state == CircuitBreakerState.FORCED_CLOSED else success_count
     )
-    assert stats == CircuitBreakerMetrics(
-        name=cb.name,
+    assert stats == replace(
+        EMPTY_METRICS,
         state=state,
-        active_calls=0,
-        total_error_count=0,
         total_success_count=success_count,
-        consecutive_error_count=0,
         consecutive_success_count=expected_consecutive,
-        last_error=None,
     )
 
 
-@pytest.mark.parametrize(
-    "call_count",
-    [0, 1, 3, 5],
-)
-@pytest.mark.parametrize(
-    "state",
-    [
-        CircuitBreakerState.CLOSED,
-        CircuitBreakerState.HALF_OPEN,
-        CircuitBreakerState.FORCED_CLOSED,
-    ],
-)
+@pytest.mark.parametrize(("state", "call_count"), COUNT_MATRIX, ids=COUNT_IDS)
 async def test_circuit_metrics_active_calls(
     state: CircuitBreakerState, call_count: int
 ) -> None:
@@ -782,10 +809,15 @@ async def test_circuit_metrics_active_calls(
     )
 
     # Act
-    async with AsyncExitStack() as stack:
+    entered = 0
+    try:
         for _ in range(call_count):
-            await stack.enter_async_context(cb)
+            await cb.__aenter__()
+            entered += 1
         metrics = cb.metrics()
+    finally:
+        for _ in range(entered):
+            await cb.__aexit__(None, None, None)
 
     # Assert
     assert metrics.active_calls == call_count
@@ -810,15 +842,10 @@ async def test_circuit_metrics_with_call_not_permitted(
         if circuit_call_not_permitted.state == CircuitBreakerState.HALF_OPEN
         else 0
     )
-    assert metrics == CircuitBreakerMetrics(
-        name=circuit_call_not_permitted.name,
+    assert metrics == replace(
+        EMPTY_METRICS,
         state=circuit_call_not_permitted.state,
         active_calls=expected_active,
-        total_error_count=0,
-        total_success_count=0,
-        consecutive_error_count=0,
-        consecutive_success_count=0,
-        last_error=None,
     )
 
 
@@ -826,31 +853,22 @@ async def test_circuit_reset() -> None:
     """Test circuit breaker resets to CLOSED after recorded calls."""
     # Arrange
     cb = CircuitBreaker("test")
-    await generate_error(cb)
-    await generate_success(cb)
+    await record_calls(cb, 1, sentinel_error)
+    await record_calls(cb, 1)
 
     # Act
     await cb.reset()
 
     # Assert
-    assert cb.metrics() == CircuitBreakerMetrics(
-        name="test",
-        state=CircuitBreakerState.CLOSED,
-        active_calls=0,
-        total_error_count=0,
-        total_success_count=0,
-        consecutive_error_count=0,
-        consecutive_success_count=0,
-        last_error=None,
-    )
+    assert cb.metrics() == EMPTY_METRICS
 
 
 async def test_circuit_reset_after_isolate() -> None:
     """Test reset returns to CLOSED and clears counts after isolate."""
     # Arrange
     cb = CircuitBreaker("test")
-    await generate_error(cb)
-    await generate_success(cb)
+    await record_calls(cb, 1, sentinel_error)
+    await record_calls(cb, 1)
     await cb.isolate()
     assert cb.state == CircuitBreakerState.FORCED_OPEN
 
@@ -861,16 +879,7 @@ async def test_circuit_reset_after_isolate() -> None:
     assert cb.state == CircuitBreakerState.CLOSED
 
     # Assert
-    assert cb.metrics() == CircuitBreakerMetrics(
-        name="test",
-        state=CircuitBreakerState.CLOSED,
-        active_calls=0,
-        total_error_count=0,
-        total_success_count=0,
-        consecutive_error_count=0,
-        consecutive_success_count=0,
-        last_error=None,
-    )
+    assert cb.metrics() == EMPTY_METRICS
 
 
 async def test_circuit_isolate_blocks_calls() -> None:
@@ -888,8 +897,9 @@ async def test_circuit_isolate_blocks_calls() -> None:
             pytest.fail("Expected not reached")
 
 
-@pytest.mark.parametrize("from_state", ALL_STATES)
-@pytest.mark.parametrize("to_state", ALL_STATES)
+@pytest.mark.parametrize(
+    ("from_state", "to_state"), TRANSITION_MATRIX, ids=TRANSITION_IDS
+)
 async def test_circuit_state_transition(
     from_state: CircuitBreakerState,
     to_state: CircuitBreakerState,
@@ -187,14 +187,17 @@ def test_thread_safety_smoke() -> None:
     """Test concurrent callers do not exceed capacity under fast bursts."""
     # Arrange
     bucket = MemoryTokenBucket(capacity=THROUGHPUT_CAPACITY, refill_rate=1)
-    results: list[bool] = []
-    lock = threading.Lock()
+    grants: list[int] = []
 
     def worker() -> None:
-        for _ in range(CALLS_PER_THREAD):
-            allowed = bucket.try_acquire(key="shared")
-            with lock:
-                results.append(allowed)
+        # Count locally and publish once, so no test-side lock serializes
+        # the workers around the bucket.
+        grants.append(
+            sum(
+                bucket.try_acquire(key="shared")
+                for _ in range(CALLS_PER_THREAD)
+            )
+        )
 
     # Act
     threads = [threading.Thread(target=worker) for _ in range(THREAD_COUNT)]
@@ -204,7 +207,7 @@ def test_thread_safety_smoke() -> None:
         t.join()
 
     # Assert: capacity + small refill slack were granted, no more.
-    granted = sum(1 for r in results if r)
+    granted = sum(grants)
     assert (
         THROUGHPUT_CAPACITY <= granted <= THROUGHPUT_CAPACITY + THROUGHPUT_SLACK
     )